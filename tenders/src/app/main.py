@@ -1,14 +1,20 @@
+from contextlib import asynccontextmanager
+
+import orjson
+
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
+from pydantic import BaseModel
 from starlette import status
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
+from starlette.routing import Route
 
-from db import models
+from app.middleware import OpenCORSMiddleware, PingMiddleware
 from app.routers import bids, ping, tenders
-from db.database import engine
+from app.settings import get_settings
+from db.database import create_tables, engine, warm_up_pool
 from proposal_manager.bids.exceptions import BidNotFoundError, BidNotFoundErrorResponse
 from proposal_manager.exceptions import (
     UserNotFoundError,
@@ -27,30 +33,64 @@ tags_metadata = [
 ]
 
 
-def add_custom_handler(exception_class: type[Exception], response_model, status_code: int):
-    async def handler(request: Request, exc: exception_class):
-        reason = getattr(exc, "reason", str(exc))
-        return JSONResponse(
-            status_code=status_code,
-            content=response_model(reason=reason).dict()
-        )
-
-    return handler
+exception_responses: dict[type[Exception], tuple[type[BaseModel], int]] = {
+    UserNotFoundError: (UserNotFoundErrorResponse, status.HTTP_401_UNAUTHORIZED),
+    UnauthorizedCreationError: (UnauthorizedCreationErrorResponse, status.HTTP_403_FORBIDDEN),
+    TenderNotFoundError: (TenderNotFoundErrorResponse, status.HTTP_404_NOT_FOUND),
+    BidNotFoundError: (BidNotFoundErrorResponse, status.HTTP_404_NOT_FOUND),
+    TenderBidError: (TenderBidErrorResponse, status.HTTP_404_NOT_FOUND),
+    ValueError: (BadRequestErrorResponse, status.HTTP_400_BAD_REQUEST),
+}
 
 
-def make_app() -> FastAPI:
-    app = FastAPI(openapi_tags=tags_metadata)
+async def custom_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    # Starlette picks the handler by walking the MRO, so subclasses (e.g. pydantic's
+    # ValidationError for ValueError) have to be resolved the same way here.
+    for exception_class in type(exc).__mro__:
+        if exception_class in exception_responses:
+            response_model, status_code = exception_responses[exception_class]
+            break
+    reason = getattr(exc, "reason", str(exc))
+    return ORJSONResponse(
+        status_code=status_code,
+        content=response_model(reason=reason).model_dump()
+    )
 
-    models.Base.metadata.create_all(bind=engine)
 
-    app.add_middleware(
-        CORSMiddleware,  # type: ignore
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+async def request_validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
+    # Only the first error is reported: str(exc) would format the whole error list.
+    error = exc.errors()[0]
+    location = ".".join(str(part) for part in error["loc"])
+    return ORJSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"reason": f"{location}: {error['msg']}"}
     )
 
+
+async def openapi_json(request: Request) -> Response:
+    """Serve the OpenAPI schema from bytes rendered once instead of re-encoding it per request."""
+    app = request.app
+    if not hasattr(app.state, "openapi_json"):
+        app.state.openapi_json = orjson.dumps(app.openapi())
+    return Response(app.state.openapi_json, media_type="application/json")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if get_settings().run_migrations:
+        await create_tables()
+    await warm_up_pool()
+    app.state.openapi_json = orjson.dumps(app.openapi())
+    yield
+    await engine.dispose()
+
+
+def make_app() -> FastAPI:
+    app = FastAPI(openapi_tags=tags_metadata, lifespan=lifespan, default_response_class=ORJSONResponse)
+
+    app.add_middleware(OpenCORSMiddleware)  # type: ignore
+    app.add_middleware(PingMiddleware)  # type: ignore
+
     app.include_router(bids.router, prefix="/api")
     app.include_router(ping.router, prefix="/api")
     app.include_router(tenders.router, prefix="/api")
@@ -59,34 +99,11 @@ def make_app() -> FastAPI:
     def docs_redirect() -> RedirectResponse:
         return RedirectResponse("/docs")
 
-    app.add_exception_handler(
-        RequestValidationError,
-        add_custom_handler(RequestValidationError, BadRequestErrorResponse, status.HTTP_400_BAD_REQUEST)
-    )
-    app.add_exception_handler(
-        UserNotFoundError,
-        add_custom_handler(UserNotFoundError, UserNotFoundErrorResponse, status.HTTP_401_UNAUTHORIZED)
-    )
-    app.add_exception_handler(
-        UnauthorizedCreationError,
-        add_custom_handler(UnauthorizedCreationError, UnauthorizedCreationErrorResponse, status.HTTP_403_FORBIDDEN)
-    )
-    app.add_exception_handler(
-        TenderNotFoundError,
-        add_custom_handler(TenderNotFoundError, TenderNotFoundErrorResponse, status.HTTP_404_NOT_FOUND)
-    )
-    app.add_exception_handler(
-        BidNotFoundError,
-        add_custom_handler(BidNotFoundError, BidNotFoundErrorResponse, status.HTTP_404_NOT_FOUND)
-    )
-    app.add_exception_handler(
-        TenderBidError,
-        add_custom_handler(TenderBidError, TenderBidErrorResponse, status.HTTP_404_NOT_FOUND)
-    )
-    app.add_exception_handler(
-        ValueError,
-        add_custom_handler(ValueError, BadRequestErrorResponse, status.HTTP_400_BAD_REQUEST)
-    )
+    app.add_exception_handler(RequestValidationError, request_validation_exception_handler)
+    for exception_class in exception_responses:
+        app.add_exception_handler(exception_class, custom_exception_handler)
+
+    app.router.routes.insert(0, Route(app.openapi_url, openapi_json, include_in_schema=False))
 
     return app
 
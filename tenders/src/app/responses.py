@@ -0,0 +1,25 @@
+from typing import Iterable
+
+from pydantic import BaseModel, TypeAdapter
+from starlette.responses import Response
+
+
+class PydanticResponse(Response):
+    """JSON response rendered straight from an already validated model.
+
+    Returning a Response from a route makes FastAPI skip response_model validation, so the
+    model is serialized exactly once; response_model stays on the route for the OpenAPI schema.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json(by_alias=True).encode()
+
+
+def json_list_response(adapter: TypeAdapter, rows: Iterable) -> Response:
+    """Validate the DTO rows a service returns with a list TypeAdapter and render them straight to JSON bytes.
+
+    This is the only place list rows go through pydantic; services hand back plain DTOs.
+    """
+    return Response(adapter.dump_json(adapter.validate_python(rows), by_alias=True), media_type="application/json")
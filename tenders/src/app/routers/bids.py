@@ -3,9 +3,12 @@ from uuid import UUID
 
 from fastapi import APIRouter, Query, Path
 from fastapi import Depends
+from fastapi.responses import Response
 
+from app.dependencies import json_body, json_body_openapi
+from app.responses import PydanticResponse, json_list_response
 from app.schemas import BidResponse, CreateBidRequest, BidStatusResponse, UpdateBidStatusResponse, EditBidRequest, \
-    BidFeedbackResponse
+    BidFeedbackResponse, BidListAdapter, BidFeedbackListAdapter
 from proposal_manager.bids.dependencies import get_service
 from proposal_manager.bids.exceptions import BidNotFoundErrorResponse
 from proposal_manager.bids.models import BidStatus, BidDecision
@@ -19,6 +22,7 @@ router = APIRouter(tags=["Bids API"])
 @router.post(
     "/bids/new",
     response_model=BidResponse,
+    openapi_extra=json_body_openapi(CreateBidRequest),
     responses={
         400: {"model": BadRequestErrorResponse, "description": "Некорректные данные"},
         401: {"model": UserNotFoundErrorResponse, "description": "Пользователь не существует или некорректен"},
@@ -27,9 +31,9 @@ router = APIRouter(tags=["Bids API"])
     }
 )
 async def create_bid(
-        bid_request: CreateBidRequest,
+        bid_request: CreateBidRequest = Depends(json_body(CreateBidRequest)),
         service: BidService = Depends(get_service)
-) -> BidResponse:
+) -> PydanticResponse:
     new_bid = await service.create_bid(
         name=bid_request.name,
         description=bid_request.description,
@@ -37,7 +41,7 @@ async def create_bid(
         author_type=bid_request.author_type,
         author_id=bid_request.author_id
     )
-    return new_bid
+    return PydanticResponse(new_bid)
 
 
 @router.get(
@@ -54,8 +58,9 @@ async def get_user_bids(
     offset: int = Query(0, ge=0, description="Сколько объектов пропустить с начала"),
     username: str = Query(..., description="Уникальный slug пользователя"),
     service: BidService = Depends(get_service),
-) -> List[BidResponse]:
-    return await service.get_user_bids(username, limit, offset)
+) -> Response:
+    bids = await service.get_user_bids(username, limit, offset)
+    return json_list_response(BidListAdapter, bids)
 
 
 @router.get(
@@ -76,8 +81,9 @@ async def get_bids_for_tender(
     limit: int = Query(5, ge=0, le=50, description="Максимальное число возвращаемых объектов"),
     offset: int = Query(0, ge=0, description="Сколько объектов пропустить с начала"),
     bid_service: BidService = Depends(get_service),
-) -> List[BidResponse]:
-    return await bid_service.get_bids_for_tender(tenderId, username, limit, offset)
+) -> Response:
+    bids = await bid_service.get_bids_for_tender(tenderId, username, limit, offset)
+    return json_list_response(BidListAdapter, bids)
 
 
 @router.get(
@@ -115,13 +121,15 @@ async def update_bid_status(
         status: BidStatus,
         username: str = Query(None, description="Уникальный slug пользователя"),
         service: BidService = Depends(get_service)
-) -> UpdateBidStatusResponse:
-    return await service.update_bid_status(bid_id=bidId, status=status, username=username)
+) -> PydanticResponse:
+    updated_bid = await service.update_bid_status(bid_id=bidId, status=status, username=username)
+    return PydanticResponse(updated_bid)
 
 
 @router.patch(
     "/bids/{bidId}/edit",
     response_model=BidResponse,
+    openapi_extra=json_body_openapi(EditBidRequest),
     responses={
         400: {"description": "Некорректные данные"},
         401: {"model": BadRequestErrorResponse, "description": "Пользователь не существует или некорректен"},
@@ -131,12 +139,13 @@ async def update_bid_status(
     }
 )
 async def edit_tender(
-        bid_data: EditBidRequest,
         bidId: UUID,
+        bid_data: EditBidRequest = Depends(json_body(EditBidRequest)),
         username: str = Query(..., description="Уникальный slug пользователя"),
         service: BidService = Depends(get_service)
-) -> BidResponse:
-    return await service.edit_bid(bid_id=bidId, username=username, bid_data=bid_data)
+) -> PydanticResponse:
+    edited_bid = await service.edit_bid(bid_id=bidId, username=username, bid_data=bid_data)
+    return PydanticResponse(edited_bid)
 
 
 @router.put("/bids/{bidId}/rollback/{version}", response_model=BidResponse)
@@ -145,8 +154,9 @@ async def rollback_bid_version(
         version: int = Path(..., ge=1, description="Номер версии, к которой нужно откатить предложение"),
         username: str = Query(..., description="Уникальный slug пользователя"),
         service: BidService = Depends(get_service)
-):
-    return await service.rollback_bid_version(bid_id=bidId, version=version, username=username)
+) -> PydanticResponse:
+    rolled_back_bid = await service.rollback_bid_version(bid_id=bidId, version=version, username=username)
+    return PydanticResponse(rolled_back_bid)
 
 
 @router.put("/bids/{bidId}/submit_decision", response_model=BidResponse)
@@ -155,8 +165,9 @@ async def submit_bid_decision(
         decision: BidDecision = Query(..., description="Решение по предложению"),
         username: str = Query(..., description="Уникальный slug пользователя"),
         service: BidService = Depends(get_service)
-):
-    return await service.submit_bid_decision(bid_id=bidId, decision=decision, username=username)
+) -> PydanticResponse:
+    bid = await service.submit_bid_decision(bid_id=bidId, decision=decision, username=username)
+    return PydanticResponse(bid)
 
 
 @router.put("/bids/{bidId}/feedback", response_model=BidResponse)
@@ -165,8 +176,9 @@ async def submit_bid_feedback(
         bidFeedback: str = Query(..., max_length=1000),
         username: str = Query(...),
         service: BidService = Depends(get_service)
-) -> BidResponse:
-    return await service.submit_feedback(bidId=bidId, bidFeedback=bidFeedback, username=username)
+) -> PydanticResponse:
+    bid = await service.submit_feedback(bidId=bidId, bidFeedback=bidFeedback, username=username)
+    return PydanticResponse(bid)
 
 
 @router.get("/bids/{tenderId}/reviews", response_model=List[BidFeedbackResponse])
@@ -177,7 +189,7 @@ async def get_bid_reviews(
         limit: int = Query(5, ge=0, le=50, description="Максимальное число возвращаемых объектов"),
         offset: int = Query(0, ge=0, description="Количество пропущенных объектов"),
         service: BidService = Depends(get_service)
-) -> List[BidFeedbackResponse]:
+) -> Response:
     reviews = await service.get_reviews_for_author(
         tender_id=tenderId,
         author_username=authorUsername,
@@ -185,4 +197,4 @@ async def get_bid_reviews(
         limit=limit,
         offset=offset
     )
-    return reviews
+    return json_list_response(BidFeedbackListAdapter, reviews)
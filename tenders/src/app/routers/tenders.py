@@ -2,9 +2,12 @@ from typing import Optional, List
 from uuid import UUID
 
 from fastapi import APIRouter, Query, Depends
+from fastapi.responses import Response
 
+from app.dependencies import json_body, json_body_openapi
+from app.responses import PydanticResponse, json_list_response
 from app.schemas import TenderResponse, CreateTenderRequest, TenderStatusResponse, EditTenderRequest, \
-    CreateTenderResponse
+    CreateTenderResponse, TenderListAdapter
 from proposal_manager.exceptions import BadRequestErrorResponse, UnauthorizedCreationErrorResponse, \
     UserNotFoundErrorResponse
 from proposal_manager.tenders.dependencies import get_service
@@ -28,14 +31,15 @@ async def get_tenders(
         limit: int = Query(5, ge=0, le=50, description="Максимальное число возвращаемых объектов"),
         offset: int = Query(0, ge=0, description="Количество пропускаемых объектов с начала"),
         service_type: Optional[List[TenderServiceType]] = Query(None, description="Фильтр по типу услуг"),
-) -> List[TenderResponse]:
+) -> Response:
     tenders = await service.get_tenders(limit, offset, service_type)
-    return tenders
+    return json_list_response(TenderListAdapter, tenders)
 
 
 @router.post(
     "/tenders/new",
     response_model=CreateTenderResponse,
+    openapi_extra=json_body_openapi(CreateTenderRequest),
     responses={
         400: {"model": BadRequestErrorResponse, "description": "Некорректные данные"},
         401: {"model": UserNotFoundErrorResponse, "description": "Пользователь не существует или некорректен"},
@@ -44,9 +48,9 @@ async def get_tenders(
     }
 )
 async def create_tender(
-        tender_request: CreateTenderRequest,
+        tender_request: CreateTenderRequest = Depends(json_body(CreateTenderRequest)),
         service: TenderService = Depends(get_service)
-) -> CreateTenderResponse:
+) -> PydanticResponse:
     new_tender = await service.create_tender(
         name=tender_request.name,
         description=tender_request.description,
@@ -54,7 +58,7 @@ async def create_tender(
         organization_id=tender_request.organization_id,
         creator_username=tender_request.creator_username
     )
-    return new_tender
+    return PydanticResponse(CreateTenderResponse.model_validate(new_tender))
 
 
 @router.get(
@@ -71,9 +75,9 @@ async def get_user_tenders(
         offset: int = Query(0, ge=0, description="Количество пропускаемых объектов с начала"),
         username: str = Query(None, description="Уникальный slug пользователя"),
         service: TenderService = Depends(get_service)
-) -> List[TenderResponse]:
+) -> Response:
     tenders = await service.get_user_tenders(username, limit, offset)
-    return tenders
+    return json_list_response(TenderListAdapter, tenders)
 
 
 @router.get(
@@ -112,14 +116,15 @@ async def update_tender_status(
         status: TenderStatus,
         username: str = Query(None, description="Уникальный slug пользователя"),
         service: TenderService = Depends(get_service)
-) -> TenderStatusResponse:
+) -> PydanticResponse:
     updated_tender = await service.update_tender_status(tender_id=tenderId, status=status, username=username)
-    return updated_tender
+    return PydanticResponse(updated_tender)
 
 
 @router.patch(
     "/tenders/{tenderId}/edit",
     response_model=TenderResponse,
+    openapi_extra=json_body_openapi(EditTenderRequest),
     responses={
         400: {"description": "Некорректные данные"},
         401: {"model": BadRequestErrorResponse, "description": "Пользователь не существует или некорректен"},
@@ -129,13 +134,13 @@ async def update_tender_status(
     }
 )
 async def edit_tender(
-        tender_data: EditTenderRequest,
         tenderId: UUID,
+        tender_data: EditTenderRequest = Depends(json_body(EditTenderRequest)),
         username: str = Query(..., description="Уникальный slug пользователя"),
         service: TenderService = Depends(get_service)
-) -> TenderResponse:
+) -> PydanticResponse:
     updated_tender = await service.edit_tender(tender_id=tenderId, username=username, tender_data=tender_data)
-    return updated_tender
+    return PydanticResponse(TenderResponse.model_validate(updated_tender))
 
 @router.put(
     "/tenders/{tenderId}/rollback/{version}",
@@ -153,6 +158,6 @@ async def rollback_tender(
         version: int,
         username: str = Query(..., description="Уникальный slug пользователя"),
         service: TenderService = Depends(get_service)
-) -> TenderResponse:
+) -> PydanticResponse:
     rolled_back_tender = await service.rollback_tender(tender_id=tenderId, version=version, username=username)
-    return rolled_back_tender
+    return PydanticResponse(TenderResponse.model_validate(rolled_back_tender))
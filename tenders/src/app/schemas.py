@@ -1,26 +1,41 @@
 from datetime import datetime
-from typing import Optional
+from functools import cache
+from typing import List, Literal, Optional, TypedDict
 from uuid import UUID
 
-from pydantic import BaseModel, constr, Field, ConfigDict
+from pydantic import BaseModel, constr, Field, ConfigDict, TypeAdapter, field_serializer
 from pydantic.alias_generators import to_camel
 
-from proposal_manager.bids.models import AuthorType, BidStatus
-from proposal_manager.tenders.models import TenderServiceType, TenderStatusEnum
+# Literal mirrors of the enums in proposal_manager.*.models: pydantic-core checks
+# them with a plain value lookup instead of going through Enum construction.
+AuthorTypeLiteral = Literal["Organization", "User"]
+BidStatusLiteral = Literal["Created", "Published", "Canceled"]
+TenderServiceTypeLiteral = Literal["Construction", "Delivery", "Manufacture"]
+TenderStatusLiteral = Literal["Created", "Published", "Closed"]
+
+
+cached_to_camel = cache(to_camel)
 
 
 class BaseSchema(BaseModel):
     model_config = ConfigDict(
-        alias_generator=to_camel,
+        alias_generator=cached_to_camel,
         populate_by_name=True,
         from_attributes=True,
+        extra="ignore",
+        validate_assignment=False,
+        arbitrary_types_allowed=False,
     )
 
+    @field_serializer("created_at", when_used="json", check_fields=False)
+    def serialize_created_at(self, value: datetime) -> str:
+        return value.isoformat(timespec='seconds') + 'Z'
+
 
 class CreateTenderRequest(BaseSchema):
     name: constr(max_length=100)
     description: constr(max_length=500)
-    service_type: TenderServiceType
+    service_type: TenderServiceTypeLiteral
     organization_id: UUID
     creator_username: constr(min_length=1)
 
@@ -34,11 +49,16 @@ class CreateTenderResponse(BaseSchema):
     version: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(timespec='seconds') + 'Z'
-        }
+
+class TenderDTO(TypedDict):
+    id: UUID
+    name: str
+    description: str
+    status: str
+    service_type: str
+    organization_id: UUID
+    version: int
+    created_at: datetime
 
 
 class TenderResponse(BaseSchema):
@@ -51,63 +71,56 @@ class TenderResponse(BaseSchema):
     version: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(timespec='seconds') + 'Z'
-        }
-
 
 class TenderStatusResponse(BaseSchema):
-    status: TenderStatusEnum
+    status: TenderStatusLiteral
 
 
 class EditTenderRequest(BaseSchema):
     name: Optional[str] = Field(None, max_length=100, description="Полное название тендера")
     description: Optional[str] = Field(None, max_length=500, description="Описание тендера")
-    service_type: Optional[TenderServiceType] = Field(None, description="Вид услуги, к которой относится тендер")
+    service_type: Optional[TenderServiceTypeLiteral] = Field(None, description="Вид услуги, к которой относится тендер")
 
 
 class CreateBidRequest(BaseSchema):
     name: constr(max_length=100)
     description: constr(max_length=500)
     tender_id: UUID
-    author_type: AuthorType
+    author_type: AuthorTypeLiteral
     author_id: UUID
 
 
+class BidDTO(TypedDict):
+    id: UUID
+    name: str
+    status: str
+    tender_id: UUID
+    author_type: str
+    author_id: UUID
+    version: int
+    created_at: datetime
+
+
 class BidResponse(BaseSchema):
     id: UUID
     name: constr(max_length=100)
     status: str
     tender_id: UUID
-    author_type: AuthorType
+    author_type: AuthorTypeLiteral
     author_id: UUID
     version: int = 1
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(timespec='seconds') + 'Z'
-        }
-
 
 class UpdateBidStatusResponse(BaseSchema):
     id: UUID
     name: constr(max_length=100)
     status: str
-    author_type: AuthorType
+    author_type: AuthorTypeLiteral
     author_id: UUID
     version: int = 1
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(timespec='seconds') + 'Z'
-        }
-
 
 class EditBidRequest(BaseSchema):
     name: Optional[str] = Field(None, max_length=100, description="Полное название тендера")
@@ -115,15 +128,22 @@ class EditBidRequest(BaseSchema):
 
 
 class BidStatusResponse(BaseSchema):
-    status: BidStatus
+    status: BidStatusLiteral
+
+
+
+class BidFeedbackDTO(TypedDict):
+    id: UUID
+    description: str
+    created_at: datetime
+
 
 class BidFeedbackResponse(BaseSchema):
     id: UUID
     description: str
-    createdAt: datetime
+    created_at: datetime
+
 
-    class Config:
-        orm_mode = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(timespec='seconds') + 'Z'
-        }
\ No newline at end of file
+TenderListAdapter = TypeAdapter(List[TenderResponse])
+BidListAdapter = TypeAdapter(List[BidResponse])
+BidFeedbackListAdapter = TypeAdapter(List[BidFeedbackResponse])
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -10,12 +12,17 @@ class Settings(BaseSettings):
     postgres_host: str
     postgres_port: int
     postgres_database: str
+    pool_size: int = 20
+    max_overflow: int = 40
+    pool_recycle: int = 1800
+    pool_timeout: int = 5
+    prepared_statement_cache_size: int = 500
+    run_migrations: bool = True
+    strict_loading: bool = False
 
     model_config = SettingsConfigDict(env_file=".env")
 
 
-def get_settings():
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
     return Settings()
-
-
-settings = get_settings()
@@ -1,22 +1,58 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.declarative import declarative_base
+import asyncio
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session, raiseload
 
 from app.settings import get_settings
+from db import models
+
+
+def _create_engine() -> AsyncEngine:
+    settings = get_settings()
+    return create_async_engine(
+        make_url(settings.postgres_conn).set(drivername="postgresql+asyncpg").update_query_dict(
+            {"prepared_statement_cache_size": str(settings.prepared_statement_cache_size)}
+        ),
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_pre_ping=True,
+        pool_recycle=settings.pool_recycle,
+        pool_timeout=settings.pool_timeout,
+        query_cache_size=1200,
+    )
+
+
+engine = _create_engine()
 
-settings = get_settings()
-URL_DATABASE = settings.postgres_conn
-engine = create_engine(URL_DATABASE)
+SessionLocal = async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base = declarative_base()
+if get_settings().strict_loading:
+    @event.listens_for(Session, "do_orm_execute")
+    def _raise_on_lazy_load(state: ORMExecuteState) -> None:
+        """Make any relationship that a query didn't load explicitly raise instead of lazy loading."""
+        if state.is_select and not state.is_column_load and not state.is_relationship_load:
+            state.statement = state.statement.options(raiseload("*"))
 
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
+
+async def warm_up_pool() -> None:
+    """Open pool_size connections up front so the first requests don't pay for connecting."""
+    async def ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping() for _ in range(get_settings().pool_size)))
+
+
+async def create_tables() -> None:
+    """Create missing tables; the advisory lock keeps concurrent workers from racing on DDL."""
+    async with engine.begin() as conn:
+        await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('create_tables'))"))
+        await conn.run_sync(models.Base.metadata.create_all)
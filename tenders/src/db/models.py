@@ -1,6 +1,6 @@
 import enum
 import uuid
-from sqlalchemy import Column, String, Text, Enum, ForeignKey, TIMESTAMP, func, Integer
+from sqlalchemy import Column, String, Text, Enum, ForeignKey, TIMESTAMP, func, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
@@ -30,6 +30,14 @@ class AuthorType(enum.Enum):
     USER = "User"
 
 
+# Postgres enum types shared by several tables; declaring each once keeps a single type per name.
+TENDER_STATUS = Enum('Created', 'Published', 'Closed', name='status_enum')
+SERVICE_TYPE = Enum('Construction', 'Delivery', 'Manufacture', name='service_type_enum')
+BID_STATUS = Enum('Created', 'Published', 'Canceled', name='bid_status_enum')
+AUTHOR_TYPE = Enum('Organization', 'User', name='author_type_enum')
+DECISION_TYPE = Enum('Approved', 'Rejected', name='decision_type_enum')
+
+
 class Employee(Base):
     __tablename__ = 'employee'
 
@@ -59,6 +67,9 @@ class Organization(Base):
 
 class OrganizationResponsible(Base):
     __tablename__ = 'organization_responsible'
+    __table_args__ = (
+        Index('ix_orgresp_user_org', 'user_id', 'organization_id', unique=True),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     organization_id = Column(UUID(as_uuid=True), ForeignKey('organization.id', ondelete='CASCADE'))
@@ -70,12 +81,17 @@ class OrganizationResponsible(Base):
 
 class Tender(Base):
     __tablename__ = 'tender'
+    __table_args__ = (
+        Index('ix_tender_servicetype_name', 'service_type', 'name', 'id'),
+        Index('ix_tender_name', 'name', 'id'),
+        Index('ix_tender_organization', 'organization_id'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(100), nullable=False)
     description = Column(String(500), nullable=False)
-    status = Column(Enum('Created', 'Published', 'Closed', name='status_enum'), nullable=False)
-    service_type = Column(Enum('Construction', 'Delivery', 'Manufacture', name='service_type_enum'), nullable=False)
+    status = Column(TENDER_STATUS, nullable=False)
+    service_type = Column(SERVICE_TYPE, nullable=False)
     version = Column(Integer, default=1, nullable=False)
     organization_id = Column(UUID(as_uuid=True), ForeignKey('organization.id'), nullable=False)
     creator_username = Column(String(50), ForeignKey('employee.username'), nullable=False)
@@ -88,13 +104,16 @@ class Tender(Base):
 
 class TenderVersion(Base):
     __tablename__ = 'tender_version'
+    __table_args__ = (
+        Index('ix_tenderver_tender_version', 'tender_id', 'version', unique=True),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     tender_id = Column(UUID(as_uuid=True), ForeignKey('tender.id', ondelete='CASCADE'))
     name = Column(String(100), nullable=False)
     description = Column(String(500), nullable=False)
-    status = Column(Enum('Created', 'Published', 'Closed', name='status_enum'), nullable=False)
-    service_type = Column(Enum('Construction', 'Delivery', 'Manufacture', name='service_type_enum'), nullable=False)
+    status = Column(TENDER_STATUS, nullable=False)
+    service_type = Column(SERVICE_TYPE, nullable=False)
     version = Column(Integer, nullable=False)
     organization_id = Column(UUID(as_uuid=True), ForeignKey('organization.id'), nullable=False)
     creator_username = Column(String(50), ForeignKey('employee.username'), nullable=False)
@@ -104,14 +123,17 @@ class TenderVersion(Base):
 
 class Bid(Base):
     __tablename__ = 'bid'
+    __table_args__ = (
+        Index('ix_bid_tender', 'tender_id'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(100), nullable=False)
     description = Column(String(500), nullable=False)
-    status = Column(Enum('Created', 'Published', 'Canceled', name='bid_status_enum'), nullable=False)
+    status = Column(BID_STATUS, nullable=False)
     version = Column(Integer, nullable=False, default=1)
     tender_id = Column(UUID(as_uuid=True), ForeignKey('tender.id', ondelete='CASCADE'), nullable=False)
-    author_type = Column(Enum('Organization', 'User', name='author_type_enum'), nullable=False)
+    author_type = Column(AUTHOR_TYPE, nullable=False)
     author_id = Column(UUID(as_uuid=True), nullable=False)
     created_at = Column(TIMESTAMP, server_default=func.current_timestamp())
 
@@ -122,11 +144,14 @@ class Bid(Base):
 
 class BidDecisionLog(Base):
     __tablename__ = 'bid_decision_log'
+    __table_args__ = (
+        Index('ix_biddec_bid_decision', 'bid_id', 'decision'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     bid_id = Column(UUID(as_uuid=True), ForeignKey('bid.id', ondelete='CASCADE'), nullable=False)
     responsible_id = Column(UUID(as_uuid=True), ForeignKey('organization_responsible.id', ondelete='CASCADE'), nullable=False)
-    decision = Column(Enum('Approved', 'Rejected', name='decision_type_enum'), nullable=False)
+    decision = Column(DECISION_TYPE, nullable=False)
     created_at = Column(TIMESTAMP, server_default=func.current_timestamp())
 
     bid = relationship("Bid", back_populates="decisions")
@@ -146,15 +171,18 @@ class BidFeedback(Base):
 
 class BidVersion(Base):
     __tablename__ = 'bid_version'
+    __table_args__ = (
+        Index('ix_bidver_bid_version', 'bid_id', 'version', unique=True),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     bid_id = Column(UUID(as_uuid=True), ForeignKey('bid.id', ondelete='CASCADE'), nullable=False)
     name = Column(String(100), nullable=False)
     description = Column(String(500), nullable=False)
-    status = Column(Enum("Created", "Published", "Canceled", name='bid_status_enum'), nullable=False)
+    status = Column(BID_STATUS, nullable=False)
     version = Column(Integer, nullable=False)
     tender_id = Column(UUID(as_uuid=True), ForeignKey('tender.id'), nullable=False)
-    author_type = Column(Enum('Organization', 'User', name='author_type_enum'), nullable=False)
+    author_type = Column(AUTHOR_TYPE, nullable=False)
     author_id = Column(UUID(as_uuid=True), nullable=False)
     created_at = Column(TIMESTAMP, nullable=False, server_default=func.current_timestamp())
 
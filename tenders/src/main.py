@@ -2,4 +2,4 @@ import uvicorn
 
 
 if __name__ == "__main__":
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8080, log_level="info")
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8080, loop="uvloop", http="httptools", log_level="info")
@@ -1,9 +1,9 @@
-from fastapi import Depends
-from sqlalchemy.orm import Session
+from typing import AsyncIterator
 
-from db.database import get_db
+from db.database import SessionLocal
 from proposal_manager.bids.service import BidService
 
 
-def get_service(db: Session = Depends(get_db)) -> BidService:
-    return BidService(db=db)
+async def get_service() -> AsyncIterator[BidService]:
+    async with SessionLocal() as db:
+        yield BidService(db=db)
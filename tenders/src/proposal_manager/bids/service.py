@@ -1,20 +1,41 @@
-from datetime import datetime
 from typing import List
 from uuid import UUID
 
+from cachetools import TTLCache
+from sqlalchemy import and_, event, exists, insert, select, func
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
-from app.schemas import BidResponse, BidStatusResponse, UpdateBidStatusResponse, EditBidRequest, BidFeedbackResponse
+from app.schemas import BidDTO, BidResponse, BidStatusResponse, UpdateBidStatusResponse, EditBidRequest, \
+    BidFeedbackDTO
 from db.models import Tender, Bid, OrganizationResponsible, Employee, BidVersion, BidDecisionLog, BidFeedback
 from proposal_manager.bids.exceptions import BidNotFoundError
 from proposal_manager.bids.models import AuthorType, BidStatus, BidDecision
 from proposal_manager.exceptions import UnauthorizedCreationError, UserNotFoundError, TenderBidError
 from proposal_manager.tenders.exceptions import TenderNotFoundError
 
+# Columns copied into BidDTO / BidFeedbackDTO; list endpoints select them directly instead of loading ORM objects.
+_BID_RESPONSE_COLUMNS = (
+    Bid.id, Bid.name, Bid.status, Bid.tender_id, Bid.author_type, Bid.author_id, Bid.version, Bid.created_at
+)
+_BID_FEEDBACK_RESPONSE_COLUMNS = (BidFeedback.id, BidFeedback.description, BidFeedback.created_at)
+
+# A tender never changes organization, so tender_id -> organization_id can be shared across requests.
+_TENDER_ORG_CACHE = TTLCache(maxsize=10_000, ttl=300)
+# Organization membership changes far less often than decisions are submitted.
+_ORG_RESPONSIBLE_COUNT = TTLCache(maxsize=1000, ttl=60)
+
+
+@event.listens_for(OrganizationResponsible, "after_insert")
+@event.listens_for(OrganizationResponsible, "after_update")
+@event.listens_for(OrganizationResponsible, "after_delete")
+def _forget_responsible_count(mapper, connection, target: OrganizationResponsible) -> None:
+    _ORG_RESPONSIBLE_COUNT.pop(target.organization_id, None)
+
 
 class BidService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     async def create_bid(
@@ -26,28 +47,26 @@ class BidService:
             author_id: UUID
     ) -> BidResponse:
         """Create a new bid."""
-        tender = await self._get_tender(tender_id)
-        await self._authorize_creation(author_id, tender, author_type)
+        author_type = AuthorType(author_type)
+        organization_id = await self._get_tender_org_id(tender_id)
+        await self._authorize_creation(author_id, organization_id, author_type)
 
         try:
-            new_bid = Bid(
+            new_bid = (await self.db.execute(insert(Bid).values(
                 name=name,
                 description=description,
                 tender_id=tender_id,
-                status=BidStatus.CREATED,
-                author_type=author_type,
+                status=BidStatus.CREATED.value,
+                author_type=author_type.value,
                 author_id=author_id,
                 version=1,
-                created_at=datetime.utcnow(),
-            )
-            self.db.add(new_bid)
-            self.db.commit()
-            self.db.refresh(new_bid)
+            ).returning(*_BID_RESPONSE_COLUMNS))).mappings().one()
+            await self.db.commit()
 
-            return BidResponse.from_orm(new_bid)
+            return BidResponse.model_validate(new_bid)
 
         except IntegrityError:
-            self.db.rollback()
+            await self.db.rollback()
             raise ValueError("Некорректные данные или повторяющийся идентификатор")
 
     async def get_user_bids(
@@ -55,24 +74,24 @@ class BidService:
             username: str,
             limit: int,
             offset: int
-    ) -> List[BidResponse]:
+    ) -> List[BidDTO]:
         """Fetch bids created by the user."""
         creator = await self._get_creator(username)
 
-        responsible_org_ids = self.db.query(OrganizationResponsible.organization_id).filter(
+        responsible_org_ids = select(OrganizationResponsible.organization_id).where(
             OrganizationResponsible.user_id == creator.id
-        ).subquery()
+        )
 
-        bids = self.db.query(Bid).join(
+        bids = (await self.db.execute(select(*_BID_RESPONSE_COLUMNS).join(
             Tender, Bid.tender_id == Tender.id
-        ).filter(
+        ).where(
             Tender.organization_id.in_(responsible_org_ids)
-        ).offset(offset).limit(limit).all()
+        ).offset(offset).limit(limit))).mappings().all()
 
         if not bids:
             raise BidNotFoundError("Нет предложений для данного пользователя и его организаций")
 
-        return [BidResponse.from_orm(bid) for bid in bids]
+        return [BidDTO(**bid) for bid in bids]
 
     async def get_bids_for_tender(
             self,
@@ -80,18 +99,20 @@ class BidService:
             username: str,
             limit: int,
             offset: int
-    ) -> List[BidResponse]:
+    ) -> List[BidDTO]:
         """Fetch bids for a specific tender if the user is responsible for the organization."""
         creator = await self._get_creator(username)
-        tender = await self._get_tender(tender_id)
+        organization_id = await self._get_tender_org_id(tender_id)
 
-        await self._check_organization_responsibility(creator.id, tender.organization_id)
-        bids = self.db.query(Bid).filter(Bid.tender_id == tender_id).offset(offset).limit(limit).all()
+        await self._check_organization_responsibility(creator.id, organization_id)
+        bids = (await self.db.execute(
+            select(*_BID_RESPONSE_COLUMNS).where(Bid.tender_id == tender_id).offset(offset).limit(limit)
+        )).mappings().all()
 
         if not bids:
             raise TenderBidError("Тендер или предложение не найдено")
 
-        return [BidResponse.from_orm(bid) for bid in bids]
+        return [BidDTO(**bid) for bid in bids]
 
     async def get_bid_status(
             self,
@@ -101,7 +122,6 @@ class BidService:
         """Fetch the status of a specific bid."""
         creator = await self._get_creator(username)
         bid = await self._get_bid(bid_id)
-
         await self._check_organization_responsibility(creator.id, bid.tender.organization_id)
 
         return BidStatusResponse(status=bid.status)
@@ -114,15 +134,12 @@ class BidService:
     ) -> UpdateBidStatusResponse:
         """Edit bid status."""
         creator = await self._get_creator(username)
-        bid = await self._get_bid(bid_id)
-
-        await self._check_organization_responsibility(creator.id, bid.tender.organization_id)
+        bid = await self._get_bid_for_update(bid_id, creator.id)
 
         bid.status = status.value
-        self.db.commit()
-        self.db.refresh(bid)
+        await self.db.commit()
 
-        return UpdateBidStatusResponse.from_orm(bid)
+        return UpdateBidStatusResponse.model_validate(bid)
 
     async def edit_bid(
             self,
@@ -132,56 +149,41 @@ class BidService:
     ) -> BidResponse:
         """Edit an existing bid."""
         creator = await self._get_creator(username)
-        bid = await self._get_bid(bid_id)
-
-        await self._check_organization_responsibility(creator.id, bid.tender.organization_id)
-        await self._save_bid_version(bid)
+        bid = await self._get_bid_for_update(bid_id, creator.id)
+        self._save_bid_version(bid)
 
         bid.name = bid_data.name or bid.name
         bid.description = bid_data.description or bid.description
         bid.version += 1
 
-        self.db.commit()
-        self.db.refresh(bid)
+        await self.db.commit()
 
-        return BidResponse.from_orm(bid)
+        return BidResponse.model_validate(bid)
 
     async def rollback_bid_version(self, bid_id: UUID, version: int, username: str) -> BidResponse:
         """Rollback a bid to a specific version."""
         creator = await self._get_creator(username)
-        if not creator:
-            raise UserNotFoundError("Пользователь не найден")
-
-        bid = self.db.query(Bid).filter(Bid.id == bid_id).first()
-        if not bid:
-            raise BidNotFoundError("Предложение не найдено")
-
-        is_responsible = self.db.query(OrganizationResponsible).filter(
-            OrganizationResponsible.user_id == creator.id,
-            OrganizationResponsible.organization_id == bid.tender.organization_id
-        ).first()
-
-        if not is_responsible:
-            raise UnauthorizedCreationError("Пользователь не имеет права откатывать предложение")
+        bid = await self._get_bid_for_update(
+            bid_id, creator.id, "Пользователь не имеет права откатывать предложение"
+        )
 
-        bid_version = self.db.query(BidVersion).filter(
+        bid_version = (await self.db.scalars(select(BidVersion).where(
             BidVersion.bid_id == bid_id,
             BidVersion.version == version
-        ).first()
+        ))).first()
 
         if not bid_version:
             raise BidNotFoundError("Указанная версия тендера не найдена")
 
-        await self._save_bid_version(bid)
+        self._save_bid_version(bid)
 
         bid.name = bid_version.name
         bid.description = bid_version.description
         bid.status = bid_version.status
         bid.version += 1
-        self.db.commit()
-        self.db.refresh(bid)
+        await self.db.commit()
 
-        return BidResponse.from_orm(bid)
+        return BidResponse.model_validate(bid)
 
     async def submit_bid_decision(
             self,
@@ -189,48 +191,74 @@ class BidService:
             decision: BidDecision,
             username: str
     ) -> BidResponse:
-        """Submit a decision (approve or reject) for a bid."""
-        creator = await self._get_creator(username)
-        if not creator:
-            raise UserNotFoundError("Пользователь не найден")
-
-        bid = self.db.query(Bid).filter(Bid.id == bid_id).first()
-        if not bid:
+        """Submit a decision (approve or reject) for a bid.
+
+        The caller, the bid, the caller's responsibility, their previous decision and the
+        other responsibles' decisions needed for the status change are all fetched with a
+        single query. The organization's responsible count is only needed below a quorum
+        of three and comes from a short-lived cache.
+        """
+        decision = BidDecision(decision)
+        others_decisions = and_(
+            BidDecisionLog.bid_id == Bid.id,
+            BidDecisionLog.responsible_id != OrganizationResponsible.id
+        )
+        rejected_by_others = exists().where(
+            others_decisions,
+            BidDecisionLog.decision == BidDecision.REJECTED
+        ).correlate(Bid, OrganizationResponsible)
+        approved_by_others = select(func.count(BidDecisionLog.id)).where(
+            others_decisions,
+            BidDecisionLog.decision == BidDecision.APPROVED
+        ).correlate(Bid, OrganizationResponsible).scalar_subquery()
+
+        row = (await self.db.execute(
+            select(
+                Bid,
+                OrganizationResponsible.id,
+                BidDecisionLog,
+                rejected_by_others,
+                approved_by_others,
+                Tender.organization_id,
+            ).select_from(Employee).outerjoin(
+                Bid, Bid.id == bid_id
+            ).outerjoin(
+                Tender, Tender.id == Bid.tender_id
+            ).outerjoin(OrganizationResponsible, and_(
+                OrganizationResponsible.organization_id == Tender.organization_id,
+                OrganizationResponsible.user_id == Employee.id
+            )).outerjoin(BidDecisionLog, and_(
+                BidDecisionLog.bid_id == Bid.id,
+                BidDecisionLog.responsible_id == OrganizationResponsible.id
+            )).where(Employee.username == username)
+        )).first()
+
+        if row is None:
+            raise UserNotFoundError("Пользователь не существует или некорректен")
+        bid, responsible_id, existing_decision, rejected, approved, organization_id = row
+        if bid is None:
             raise BidNotFoundError("Предложение не найдено")
-
-        responsible = self.db.query(OrganizationResponsible).filter(
-            OrganizationResponsible.user_id == creator.id,
-            OrganizationResponsible.organization_id == bid.tender.organization_id
-        ).first()
-
-        if not responsible:
+        if responsible_id is None:
             raise UnauthorizedCreationError("Пользователь не имеет права откатывать предложение")
 
-        existing_decision = self.db.query(BidDecisionLog).filter(
-            BidDecisionLog.bid_id == bid.id,
-            BidDecisionLog.responsible_id == responsible.id
-        ).first()
-
         if existing_decision:
-            existing_decision.decision = BidDecision.REJECTED
+            existing_decision.decision = decision.value
         else:
             bid_decision_log = BidDecisionLog(
                 bid_id=bid.id,
-                responsible_id=responsible.id,
-                decision=BidDecision.APPROVED
+                responsible_id=responsible_id,
+                decision=decision.value
             )
             self.db.add(bid_decision_log)
 
-        if decision == "Rejected" or await self._check_if_rejected(bid):
-            bid.status = BidStatus.CANCELED
-        else:
-            if await self._check_if_quorum_reached(bid):
-                bid.status = BidStatus.PUBLISHED
+        if decision == BidDecision.REJECTED or rejected:
+            bid.status = BidStatus.CANCELED.value
+        elif approved + 1 >= 3 or approved + 1 >= await self._get_responsible_count(organization_id):
+            bid.status = BidStatus.PUBLISHED.value
 
-        self.db.commit()
-        self.db.refresh(bid)
+        await self.db.commit()
 
-        return BidResponse.from_orm(bid)
+        return BidResponse.model_validate(bid)
 
     async def submit_feedback(
             self,
@@ -242,15 +270,11 @@ class BidService:
         if not creator:
             raise UserNotFoundError("Пользователь не найден")
 
-        bid = self.db.query(Bid).filter(Bid.id == bidId).first()
-
-        if not bid:
-            raise BidNotFoundError("Предложение не найдено")
-
-        responsible = self.db.query(OrganizationResponsible).filter(
+        bid = await self._get_bid(bidId)
+        responsible = (await self.db.scalars(select(OrganizationResponsible).where(
             OrganizationResponsible.user_id == creator.id,
             OrganizationResponsible.organization_id == bid.tender.organization_id
-        ).first()
+        ))).first()
 
         if not responsible:
             raise UnauthorizedCreationError("Пользователь не имеет права откатывать предложение")
@@ -261,7 +285,7 @@ class BidService:
             description=bidFeedback
         )
         self.db.add(feedback)
-        self.db.commit()
+        await self.db.commit()
 
         return BidResponse(
             id=bid.id,
@@ -282,116 +306,120 @@ class BidService:
             requester_username: str,
             limit: int,
             offset: int
-    ) -> List[BidFeedbackResponse]:
+    ) -> List[BidFeedbackDTO]:
         creator = await self._get_creator(requester_username)
         if not creator:
             raise UserNotFoundError("Пользователь не найден")
 
-        tender = await self._get_tender(tender_id)
-
-        is_responsible = self.db.query(OrganizationResponsible).filter(
-            OrganizationResponsible.organization_id == tender.organization_id,
-            OrganizationResponsible.username == requester_username
-        ).all()
+        organization_id = await self._get_tender_org_id(tender_id)
 
-        if not is_responsible:
+        if not await self.is_user_responsible_for_organization(creator.id, organization_id):
             raise UnauthorizedCreationError("Пользователь не имеет права откатывать предложение")
 
-        reviews = self._fetch_reviews(tender_id, author_username, limit, offset)
+        reviews = await self._fetch_reviews(tender_id, author_username, limit, offset)
         return reviews
 
-    async def _check_if_rejected(self, bid: Bid) -> bool:
-        """Check if there are any 'Rejected' decisions for the bid."""
-        rejected_decision_count = self.db.query(BidDecisionLog).filter(
-            BidDecisionLog.bid_id == bid.id,
-            BidDecisionLog.decision == BidDecision.REJECTED
-        ).count()
-        return rejected_decision_count > 0
-
-    async def _check_if_quorum_reached(self, bid: Bid) -> bool:
-        """Check if the quorum for approving the bid is reached."""
-        total_responsibles = self.db.query(OrganizationResponsible).filter(
-            OrganizationResponsible.organization_id == bid.tender.organization_id
-        ).count()
-
-        quorum = min(3, total_responsibles)
-
-        approved_decisions = self.db.query(BidDecisionLog).filter(
-            BidDecisionLog.bid_id == bid.id,
-            BidDecisionLog.decision == BidDecision.APPROVED
-        ).count()
-
-        return approved_decisions >= quorum
-
     async def _get_creator(self, username: str) -> Employee:
         """Helper method to get the creator (employee) by username."""
-        creator = self.db.query(Employee).filter(Employee.username == username).first()
+        creator = (await self.db.scalars(select(Employee).where(Employee.username == username))).first()
         if not creator:
             raise UserNotFoundError("Пользователь не существует или некорректен")
         return creator
 
     async def _get_tender(self, tender_id: UUID) -> Tender:
         """Helper method to get a tender by ID."""
-        tender = self.db.query(Tender).filter(Tender.id == tender_id).first()
+        tender = (await self.db.scalars(select(Tender).where(Tender.id == tender_id))).first()
         if not tender:
             raise TenderNotFoundError("Тендера не существует")
         return tender
 
+    async def _get_tender_org_id(self, tender_id: UUID) -> UUID:
+        """Helper method to get the organization of a tender, cached for a few minutes."""
+        organization_id = _TENDER_ORG_CACHE.get(tender_id)
+        if organization_id is None:
+            organization_id = await self.db.scalar(select(Tender.organization_id).where(Tender.id == tender_id))
+            if organization_id is None:
+                raise TenderNotFoundError("Тендера не существует")
+            _TENDER_ORG_CACHE[tender_id] = organization_id
+        return organization_id
+
+    async def _get_responsible_count(self, organization_id: UUID) -> int:
+        """Helper method to count the responsibles of an organization, cached for a minute."""
+        count = _ORG_RESPONSIBLE_COUNT.get(organization_id)
+        if count is None:
+            count = await self.db.scalar(select(func.count(OrganizationResponsible.id)).where(
+                OrganizationResponsible.organization_id == organization_id
+            ))
+            _ORG_RESPONSIBLE_COUNT[organization_id] = count
+        return count
+
     async def _get_bid(self, bid_id: UUID) -> Bid:
-        """Helper method to get a bid by ID."""
-        bid = self.db.query(Bid).filter(Bid.id == bid_id).first()
+        """Helper method to get a bid by ID, with its tender joined in for authorization checks."""
+        bid = (await self.db.scalars(
+            select(Bid).options(joinedload(Bid.tender)).where(Bid.id == bid_id)
+        )).first()
         if not bid:
             raise BidNotFoundError("Предложение не найдено")
         return bid
 
+    async def _get_bid_for_update(
+            self,
+            bid_id: UUID,
+            user_id: UUID,
+            denied_message: str = "Пользователь не имеет права выполнять данное действие"
+    ) -> Bid:
+        """Lock a bid row until commit, checking in the same query that the user may change it."""
+        is_responsible = exists().where(
+            OrganizationResponsible.user_id == user_id,
+            OrganizationResponsible.organization_id == Tender.organization_id
+        ).correlate(Tender)
+
+        row = (await self.db.execute(
+            select(Bid, is_responsible).join(
+                Tender, Bid.tender_id == Tender.id
+            ).where(Bid.id == bid_id).with_for_update(of=Bid)
+        )).first()
+
+        if row is None:
+            raise BidNotFoundError("Предложение не найдено")
+        bid, responsible = row
+        if not responsible:
+            raise UnauthorizedCreationError(denied_message)
+        return bid
+
     async def _authorize_creation(
             self,
             author_id: UUID,
-            tender: Tender,
+            organization_id: UUID,
             author_type: AuthorType
     ) -> None:
         """Authorize the creation of a bid."""
         if not await self._user_exists(author_id):
             raise UserNotFoundError(f"Пользователь не существует или некорректен.")
         if author_type == AuthorType.ORGANIZATION:
-            is_responsible = await self.is_user_responsible_for_organization(author_id, tender.organization_id)
+            is_responsible = await self.is_user_responsible_for_organization(author_id, organization_id)
             if not is_responsible:
                 raise UnauthorizedCreationError("Пользователь не имеет прав на создание предложения")
 
         elif author_type == AuthorType.USER:
             pass
 
-
-    async def _check_authorization(
-            self,
-            author_id: UUID,
-            tender: Tender,
-            author_type: AuthorType
-    ) -> bool:
-        """Check if the author is authorized to create a bid for the given tender."""
-        if author_type in [AuthorType.ORGANIZATION, AuthorType.USER]:
-            return self.db.query(OrganizationResponsible).filter(
-                OrganizationResponsible.user_id == author_id,
-                OrganizationResponsible.organization_id == tender.organization_id
-            ).first() is not None
-        return False
-
     async def _check_organization_responsibility(
             self,
             user_id: UUID,
             organization_id: UUID
     ) -> None:
         """Check if the user is responsible for the organization."""
-        is_responsible = self.db.query(OrganizationResponsible).filter(
+        is_responsible = (await self.db.scalars(select(OrganizationResponsible).where(
             OrganizationResponsible.user_id == user_id,
             OrganizationResponsible.organization_id == organization_id
-        ).first()
+        ))).first()
 
         if not is_responsible:
             raise UnauthorizedCreationError("Пользователь не имеет права выполнять данное действие")
 
-    async def _save_bid_version(self, bid: Bid) -> None:
-        """Save a version of the bid."""
+    def _save_bid_version(self, bid: Bid) -> None:
+        """Stage a version of the bid; the caller's commit writes it together with the bid update."""
         bid_version = BidVersion(
             bid_id=bid.id,
             name=bid.name,
@@ -404,31 +432,25 @@ class BidService:
             created_at=bid.created_at,
         )
         self.db.add(bid_version)
-        self.db.commit()
-
-    def _fetch_reviews(self, tender_id: UUID, author_username: str, limit: int, offset: int) -> List[
-        BidFeedbackResponse]:
-        reviews = self.db.query(BidFeedback).join(
-            BidFeedback.bid
-        ).filter(
-            BidFeedback.bid_id.in_(
-                self.db.query(Bid.id).filter(
-                    Bid.author_username == author_username,
-                    Bid.tender_id == tender_id
-                )
-            )
-        ).offset(offset).limit(limit).all()
 
-        return [BidFeedbackResponse.from_orm(review) for review in reviews]
+    async def _fetch_reviews(self, tender_id: UUID, author_username: str, limit: int, offset: int) -> List[
+        BidFeedbackDTO]:
+        reviews = (await self.db.execute(select(*_BID_FEEDBACK_RESPONSE_COLUMNS).join(
+            Bid, BidFeedback.bid_id == Bid.id
+        ).join(
+            Employee, Bid.author_id == Employee.id
+        ).where(
+            Employee.username == author_username,
+            Bid.tender_id == tender_id
+        ).offset(offset).limit(limit))).mappings().all()
 
-    async def is_user_responsible_for_organization(self, user_id: UUID, organization_id: UUID) -> bool:
-        responsible_users = await self.get_organization_responsibles(organization_id)
-        return any(user.id == user_id for user in responsible_users)
+        return [BidFeedbackDTO(**review) for review in reviews]
 
-    async def get_organization_responsibles(self, organization_id: UUID) -> List[Employee]:
-        return self.db.query(Employee).join(OrganizationResponsible).filter(
+    async def is_user_responsible_for_organization(self, user_id: UUID, organization_id: UUID) -> bool:
+        return await self.db.scalar(select(exists().where(
+            OrganizationResponsible.user_id == user_id,
             OrganizationResponsible.organization_id == organization_id
-        ).all()
+        )))
 
     async def _user_exists(self, user_id: UUID) -> bool:
-        return self.db.query(Employee).filter(Employee.id == user_id).first() is not None
\ No newline at end of file
+        return await self.db.scalar(select(exists().where(Employee.id == user_id)))
\ No newline at end of file
@@ -1,9 +1,9 @@
-from fastapi import Depends
-from sqlalchemy.orm import Session
+from typing import AsyncIterator
 
-from db.database import get_db
+from db.database import SessionLocal
 from proposal_manager.tenders.service import TenderService
 
 
-def get_service(db: Session = Depends(get_db)) -> TenderService:
-    return TenderService(db=db)
+async def get_service() -> AsyncIterator[TenderService]:
+    async with SessionLocal() as db:
+        yield TenderService(db=db)
@@ -1,19 +1,31 @@
-from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
+from sqlalchemy import Row, exists, func, insert, select, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from db.models import Tender, Employee, OrganizationResponsible, TenderVersion
-from app.schemas import TenderResponse, TenderStatusResponse, EditTenderRequest, CreateTenderResponse
+from app.schemas import TenderDTO, TenderStatusResponse, EditTenderRequest
 from proposal_manager.exceptions import UserNotFoundError, UnauthorizedCreationError
 from proposal_manager.tenders.exceptions import TenderNotFoundError
 from proposal_manager.tenders.models import TenderServiceType, TenderStatus
 
+# Columns copied into TenderDTO; list endpoints select them directly instead of loading ORM objects.
+_TENDER_DTO_COLUMNS = (
+    Tender.id, Tender.name, Tender.description, Tender.status, Tender.service_type,
+    Tender.organization_id, Tender.version, Tender.created_at
+)
+
+# Whether the selected employee is responsible for the selected tender's organization.
+_EMPLOYEE_IS_RESPONSIBLE = exists().where(
+    OrganizationResponsible.user_id == Employee.id,
+    OrganizationResponsible.organization_id == Tender.organization_id
+).correlate(Employee, Tender)
+
 
 class TenderService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     async def get_tenders(
@@ -21,21 +33,21 @@ class TenderService:
             limit: int,
             offset: int,
             service_type: Optional[List[TenderServiceType]] = None
-    ) -> List[TenderResponse]:
+    ) -> List[TenderDTO]:
         """Fetch tenders with optional filtering by service type."""
-        query = self.db.query(Tender)
+        query = select(*_TENDER_DTO_COLUMNS)
 
         if service_type:
             service_type_values = [t.value for t in service_type]
-            query = query.filter(Tender.service_type.in_(service_type_values))
+            query = query.where(Tender.service_type.in_(service_type_values))
 
-        query = query.order_by(Tender.name).offset(offset).limit(limit)
+        query = query.order_by(Tender.name, Tender.id).offset(offset).limit(limit)
 
-        tenders = query.all()
+        tenders = (await self.db.execute(query)).mappings().all()
         if not tenders:
             raise TenderNotFoundError("Тендера не существует")
 
-        return [TenderResponse.from_orm(tender) for tender in tenders]
+        return [TenderDTO(**tender) for tender in tenders]
 
     async def create_tender(
             self,
@@ -44,30 +56,27 @@ class TenderService:
             service_type: TenderServiceType,
             organization_id: UUID,
             creator_username: str
-    ) -> CreateTenderResponse:
+    ) -> TenderDTO:
         """Create a new tender."""
-        creator = self._get_creator(creator_username)
+        creator = await self._get_creator(creator_username)
 
-        if not self._check_authorization(creator, organization_id):
+        if not await self._check_authorization(creator, organization_id):
             raise UnauthorizedCreationError("Пользователь не имеет права создавать тендер для этой организации")
 
         try:
-            new_tender = Tender(
+            new_tender = (await self.db.execute(insert(Tender).values(
                 name=name,
                 description=description,
-                service_type=service_type.value,
+                service_type=TenderServiceType(service_type).value,
                 status=TenderStatus.CREATED.value,
                 organization_id=organization_id,
                 creator_username=creator_username,
                 version=1,
-                created_at=datetime.utcnow(),
-            )
-            self.db.add(new_tender)
-            self.db.commit()
-            self.db.refresh(new_tender)
-            return CreateTenderResponse.from_orm(new_tender)
+            ).returning(*_TENDER_DTO_COLUMNS))).mappings().one()
+            await self.db.commit()
+            return TenderDTO(**new_tender)
         except IntegrityError:
-            self.db.rollback()
+            await self.db.rollback()
             raise ValueError("Некорректные данные или повторяющийся идентификатор")
 
     async def edit_tender(
@@ -75,31 +84,36 @@ class TenderService:
             tender_id: UUID,
             username: str,
             tender_data: EditTenderRequest
-    ) -> TenderResponse:
+    ) -> TenderDTO:
         """Edit an existing tender."""
-        creator = self._get_creator(username)
-        tender = self._get_tender(tender_id)
+        tender, is_responsible = await self._get_tender_for_update(username, tender_id)
 
-        if not self._is_user_responsible_for_organization(username, tender.organization_id):
+        if not is_responsible:
             raise UnauthorizedCreationError("Пользователь не имеет прав на изменение тендера")
 
-        await self.save_tender_version(tender)
+        self.save_tender_version(tender)
 
+        values = {"version": Tender.version + 1}
         if tender_data.name is not None:
-            tender.name = tender_data.name
+            values["name"] = tender_data.name
         if tender_data.description is not None:
-            tender.description = tender_data.description
+            values["description"] = tender_data.description
         if tender_data.service_type is not None:
-            tender.service_type = tender_data.service_type.value
+            values["service_type"] = TenderServiceType(tender_data.service_type).value
 
-        tender.version += 1
-        self.db.commit()
-        self.db.refresh(tender)
+        edited = (await self.db.execute(
+            update(Tender)
+            .where(Tender.id == tender.id)
+            .values(**values)
+            .returning(*_TENDER_DTO_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )).mappings().one()
+        await self.db.commit()
 
-        return TenderResponse.from_orm(tender)
+        return TenderDTO(**edited)
 
-    async def save_tender_version(self, tender: Tender):
-        """Save a version of the tender."""
+    def save_tender_version(self, tender: Tender):
+        """Stage a version of the tender; the caller's commit writes it together with the tender update."""
         tender_version = TenderVersion(
             tender_id=tender.id,
             name=tender.name,
@@ -112,35 +126,35 @@ class TenderService:
             created_at=tender.created_at
         )
         self.db.add(tender_version)
-        self.db.commit()
 
     async def get_user_tenders(
             self,
             username: str,
             limit: int,
             offset: int
-    ) -> List[TenderResponse]:
+    ) -> List[TenderDTO]:
         """Fetch tenders that the user is responsible for."""
-        creator = self._get_creator(username)
-
         responsible_orgs = (
-            self.db.query(OrganizationResponsible.organization_id)
-            .filter(OrganizationResponsible.user_id == creator.id)
-            .subquery()
+            select(OrganizationResponsible.organization_id)
+            .join(Employee, OrganizationResponsible.user_id == Employee.id)
+            .where(Employee.username == username)
+            .cte("responsible_orgs")
         )
 
-        tenders = (
-            self.db.query(Tender)
-            .filter(Tender.organization_id.in_(responsible_orgs))
+        tenders = (await self.db.execute(
+            select(*_TENDER_DTO_COLUMNS)
+            .where(Tender.organization_id.in_(select(responsible_orgs.c.organization_id)))
+            .order_by(Tender.name, Tender.id)
             .offset(offset)
             .limit(limit)
-            .all()
-        )
+        )).mappings().all()
 
         if not tenders:
+            # Only an empty page needs to tell an unknown user (401) from one without tenders (404).
+            await self._get_creator(username)
             raise TenderNotFoundError("Тендера не существует")
 
-        return [TenderResponse.from_orm(tender) for tender in tenders]
+        return [TenderDTO(**tender) for tender in tenders]
 
     async def get_tender_status(
             self,
@@ -148,10 +162,9 @@ class TenderService:
             username: str
     ) -> TenderStatusResponse:
         """Fetch the status of a specific tender."""
-        creator = self._get_creator(username)
-        tender = self._get_tender(tender_id)
+        tender = await self._get_tender_auth_fields(username, tender_id)
 
-        if not self._is_authorized_for_status(username, tender):
+        if tender.creator_username != username and not tender.is_responsible:
             raise UnauthorizedCreationError("Пользователь не имеет прав получения статуса")
 
         return TenderStatusResponse(status=tender.status)
@@ -163,80 +176,120 @@ class TenderService:
             username: str
     ) -> TenderStatusResponse:
         """Update the status of a specific tender."""
-        creator = self._get_creator(username)
-        tender = self._get_tender(tender_id)
+        tender = await self._get_tender_auth_fields(username, tender_id)
 
-        if not self._is_user_responsible_for_organization(username, tender.organization_id):
+        if not tender.is_responsible:
             raise UnauthorizedCreationError("Пользователь не имеет прав на изменение статуса тендера")
 
-        tender.status = status.value
-        self.db.commit()
-        self.db.refresh(tender)
+        await self.db.execute(
+            update(Tender)
+            .where(Tender.id == tender_id)
+            .values(status=status.value)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
 
-        return TenderStatusResponse(status=tender.status)
+        return TenderStatusResponse(status=status.value)
 
     async def rollback_tender(
             self,
             tender_id: UUID,
             version: int,
             username: str
-    ) -> TenderResponse:
-        creator = self._get_creator(username)
-        tender = self._get_tender(tender_id)
+    ) -> TenderDTO:
+        tender, is_responsible = await self._get_tender_for_update(username, tender_id)
 
-        if tender.creator_username != username and not self._check_authorization(creator, tender.organization_id):
+        if tender.creator_username != username and not is_responsible:
             raise UnauthorizedCreationError("Пользователь не имеет прав на откат тендера")
 
-        tender_version = self.db.query(TenderVersion).filter_by(
+        tender_version = (await self.db.scalars(select(TenderVersion).filter_by(
             tender_id=tender_id, version=version
-        ).first()
+        ))).first()
 
         if not tender_version:
             raise TenderNotFoundError("Указанная версия тендера не найдена")
 
-        await self.save_tender_version(tender)
+        self.save_tender_version(tender)
 
         tender.name = tender_version.name
         tender.description = tender_version.description
         tender.service_type = tender_version.service_type
         tender.status = tender_version.status
         tender.version += 1
-        tender.created_at = datetime.utcnow()
+        tender.created_at = func.now()
 
-        self.db.commit()
-        self.db.refresh(tender)
+        await self.db.commit()
+        await self.db.refresh(tender)
 
-        return TenderResponse.from_orm(tender)
+        return self._to_dto(tender)
 
-    def _is_user_responsible_for_organization(self, username: str, organization_id: UUID) -> bool:
-        """Check if the user is responsible for the given organization."""
-        return self.db.query(OrganizationResponsible).join(Employee).filter(
-            Employee.username == username,
-            OrganizationResponsible.organization_id == organization_id
-        ).first() is not None
+    @staticmethod
+    def _to_dto(tender: Tender) -> TenderDTO:
+        """Copy the response-facing columns of a tender row into a plain dict."""
+        return TenderDTO(
+            id=tender.id,
+            name=tender.name,
+            description=tender.description,
+            status=tender.status,
+            service_type=tender.service_type,
+            organization_id=tender.organization_id,
+            version=tender.version,
+            created_at=tender.created_at,
+        )
 
-    def _get_creator(self, username: str) -> Employee:
+    async def _get_creator(self, username: str) -> Employee:
         """Helper method to get the creator (employee) by username."""
-        creator = self.db.query(Employee).filter(Employee.username == username).first()
+        creator = (await self.db.scalars(select(Employee).where(Employee.username == username))).first()
         if not creator:
             raise UserNotFoundError("Пользователь не существует или некорректен")
         return creator
 
-    def _check_authorization(self, creator: Employee, organization_id: UUID) -> bool:
+    async def _get_tender_for_update(self, username: str, tender_id: UUID) -> Tuple[Tender, bool]:
+        """Helper method to lock a tender row until commit, checking in the same query that the
+        user exists and whether they are responsible for the tender's organization."""
+        user_exists = exists().where(Employee.username == username)
+        is_responsible = exists().where(
+            OrganizationResponsible.user_id == Employee.id,
+            OrganizationResponsible.organization_id == Tender.organization_id,
+            Employee.username == username
+        ).correlate(Tender)
+
+        row = (await self.db.execute(
+            select(Tender, user_exists, is_responsible).where(Tender.id == tender_id).with_for_update(of=Tender)
+        )).first()
+
+        if row is None:
+            # An unknown user still gets 401 before an unknown tender gets 404.
+            await self._get_creator(username)
+            raise TenderNotFoundError("Тендера не существует")
+        tender, user_exists, is_responsible = row
+        if not user_exists:
+            raise UserNotFoundError("Пользователь не существует или некорректен")
+        return tender, bool(is_responsible)
+
+    async def _get_tender_auth_fields(self, username: str, tender_id: UUID) -> Row:
+        """Helper method to get just the tender columns needed for status checks, plus whether
+        the user is responsible for the tender's organization, without loading ORM objects."""
+        row = (await self.db.execute(
+            select(
+                Tender.id,
+                Tender.status,
+                Tender.creator_username,
+                _EMPLOYEE_IS_RESPONSIBLE.label("is_responsible"),
+            ).select_from(Employee).outerjoin(
+                Tender, Tender.id == tender_id
+            ).where(Employee.username == username)
+        )).first()
+
+        if row is None:
+            raise UserNotFoundError("Пользователь не существует или некорректен")
+        if row.id is None:
+            raise TenderNotFoundError("Тендера не существует")
+        return row
+
+    async def _check_authorization(self, creator: Employee, organization_id: UUID) -> bool:
         """Check if the creator is authorized for the given organization."""
-        return self.db.query(OrganizationResponsible).filter(
+        return await self.db.scalar(select(exists().where(
             OrganizationResponsible.user_id == creator.id,
             OrganizationResponsible.organization_id == organization_id
-        ).first() is not None
-
-    def _get_tender(self, tender_id: UUID) -> Tender:
-        """Helper method to get a tender by ID."""
-        tender = self.db.query(Tender).filter(Tender.id == tender_id).first()
-        if not tender:
-            raise TenderNotFoundError("Тендера не существует")
-        return tender
-
-    def _is_authorized_for_status(self, username: str, tender: Tender) -> bool:
-        """Check if the user is authorized to get the status of the tender."""
-        return (tender.creator_username == username) or self._check_authorization(self._get_creator(username),
-                                                                                  tender.organization_id)
+        )))
@@ -0,0 +1,61 @@
+import asyncio
+import os
+import uuid
+
+import asyncpg
+import httpx
+import pytest
+
+
+@pytest.fixture(scope="module")
+def http():
+    with httpx.Client(base_url="http://localhost:8080/api") as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def responsible():
+    """Seed an employee responsible for a fresh organization; the API has no endpoints for either."""
+    postgres_conn = os.environ.get("POSTGRES_CONN")
+    if not postgres_conn:
+        pytest.skip("POSTGRES_CONN is not set")
+
+    username = f"reviewer_{uuid.uuid4().hex[:8]}"
+    user_id, organization_id = uuid.uuid4(), uuid.uuid4()
+
+    async def seed():
+        conn = await asyncpg.connect(postgres_conn)
+        try:
+            await conn.execute("INSERT INTO employee (id, username) VALUES ($1, $2)", user_id, username)
+            await conn.execute("INSERT INTO organization (id, name) VALUES ($1, $2)", organization_id, username)
+            await conn.execute(
+                "INSERT INTO organization_responsible (id, organization_id, user_id) VALUES ($1, $2, $3)",
+                uuid.uuid4(), organization_id, user_id
+            )
+        finally:
+            await conn.close()
+
+    asyncio.run(seed())
+    return username, user_id, organization_id
+
+
+@pytest.mark.integration
+def test_get_bid_reviews(http, responsible):
+    username, user_id, organization_id = responsible
+
+    tender = http.post("/tenders/new", json={
+        "name": "Tender", "description": "Tender for reviews", "serviceType": "Construction",
+        "organizationId": str(organization_id), "creatorUsername": username
+    }).json()
+    bid = http.post("/bids/new", json={
+        "name": "Bid", "description": "Bid for reviews", "tenderId": tender["id"],
+        "authorType": "Organization", "authorId": str(user_id)
+    }).json()
+    http.put(f"/bids/{bid['id']}/feedback", params={"username": username, "bidFeedback": "Good bid"})
+
+    response = http.get(f"/bids/{tender['id']}/reviews", params={
+        "authorUsername": username, "requesterUsername": username
+    })
+
+    assert response.status_code == 200, f"Expected status code 200, got {response.status_code}"
+    assert [review["description"] for review in response.json()] == ["Good bid"]